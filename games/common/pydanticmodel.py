@@ -1,10 +1,16 @@
+import json
 from enum import Enum
-from typing import (AbstractSet, Any, Callable, Dict, Iterable, List, Mapping,
-                    Optional, Set, Tuple, Union)
+from typing import (AbstractSet, Any, Callable, ClassVar, Dict, FrozenSet,
+                    Iterable, List, Mapping, Optional, Set, Tuple, Union)
 
 import pandas as pd
 from pydantic import BaseModel, Extra
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 IntStr = Union[int, str]
 AbstractSetIntStr = AbstractSet[IntStr]
 DictIntStrAny = Dict[IntStr, Any]
@@ -12,29 +18,48 @@ DictStrAny = Dict[str, Any]
 MappingIntStrAny = Mapping[IntStr, Any]
 
 
+def json_dumps(obj: Any, *, default: Optional[Callable[[Any], Any]] = None, **dumps_kwargs: Any) -> str:
+    """Serialize with orjson if it's installed, unless keyword arguments only understood by ``json.dumps`` are given."""
+    if orjson is None or dumps_kwargs:
+        return json.dumps(obj, default=default, **dumps_kwargs)
+    return orjson.dumps(obj, default=default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS).decode()
+
+
 class PydanticModel(BaseModel):
+    # names of the model's declared fields, in declaration order & as a set (see `__init_subclass__`)
+    _field_names: ClassVar[Tuple[str, ...]] = ()
+    _all_field_names: ClassVar[FrozenSet[str]] = frozenset()
+
     class Config:
         arbitrary_types_allowed = True
         extra = Extra.allow
         json_encoders = {Enum: lambda v: v.value, pd.DataFrame: lambda df: df.to_dict("records")}
+        json_dumps = json_dumps
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_names = tuple(cls.__fields__)
+        cls._all_field_names = frozenset(cls._field_names)
 
     def tuple(self: BaseModel) -> Tuple[Any]:
         """Return a tuple of the pydantic model's attribute values."""
-        return tuple(self.dict().values())
+        values = self.__dict__
+        return tuple(values[name] for name in self._field_names)
 
     @classmethod
     def from_args(cls, *args, **kwargs) -> "PydanticModel":
-        arg_fields = [field_name for field_name in cls.__fields__ if field_name not in kwargs]
+        arg_fields = [field_name for field_name in cls._field_names if field_name not in kwargs]
         kwargs.update(dict(zip(arg_fields, args)))
         return cls(**kwargs)
 
     def __repr_args__(self) -> Any:
-        return self.dict().items()
+        values = self.__dict__
+        return [(name, values[name]) for name in self._field_names]
 
     def _format_include_or_exclude(self, arg: Any) -> Set:
         if arg is None:
             return arg
-        elif isinstance(arg, Mapping):
+        elif isinstance(arg, (AbstractSet, Mapping)):
             return arg
         elif isinstance(arg, Iterable):
             return set(arg)
@@ -52,9 +77,10 @@ class PydanticModel(BaseModel):
         exclude_defaults: bool = False,
         exclude_none: bool = False,
     ) -> "DictStrAny":
-
+        # NOTE: extra attributes (e.g., Treatment._demand_rvs) are stored alongside the fields with Extra.allow,
+        # so only the declared fields are included by default
         return super().dict(
-            include=self._format_include_or_exclude(include) or set([c for c in self.__fields__]),
+            include=self._format_include_or_exclude(include) or self._all_field_names,
             exclude=self._format_include_or_exclude(exclude),
             by_alias=by_alias,
             skip_defaults=skip_defaults,
@@ -77,7 +103,7 @@ class PydanticModel(BaseModel):
         **dumps_kwargs: Any,
     ) -> str:
         return super().json(
-            include=self._format_include_or_exclude(include) or set([c for c in self.__fields__]),
+            include=self._format_include_or_exclude(include) or self._all_field_names,
             exclude=self._format_include_or_exclude(exclude),
             by_alias=by_alias,
             skip_defaults=skip_defaults,
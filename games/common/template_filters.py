@@ -1,5 +1,5 @@
 # See https://otree.readthedocs.io/en/latest/misc/otreelite.html?highlight=filter#templates
-from typing import Iterable
+from typing import Iterable, Sized
 
 from otree.templating import filters
 
@@ -11,10 +11,11 @@ def _type(value):
 
 @filters.register("len")
 def _len(value):
-    try:
+    if value is None:
+        return 0
+    if isinstance(value, Sized):
         return len(value)
-    except:
-        return 0 if not value else 1
+    return 0 if not value else 1
 
 
 @filters.register
@@ -22,8 +23,17 @@ def isiterable(value):
     return isinstance(value, Iterable)
 
 
+def _is_integral(value) -> bool:
+    return isinstance(value, int) or value.is_integer()
+
+
 @filters.register
 def add(value, other=0):
+    # fast path for plain numbers (the common case) so no exception is raised & caught
+    if isinstance(value, (int, float)) and isinstance(other, (int, float)):
+        if _is_integral(value) and _is_integral(other):
+            return int(value + other)
+        return float(value) + float(other)
     try:
         if int(value) == value and int(other) == other:
             return int(value + other)
@@ -42,6 +52,11 @@ def add(value, other=0):
 
 @filters.register
 def mul(value, other=0):
+    # fast path for plain numbers (the common case) so no exception is raised & caught
+    if isinstance(value, (int, float)) and isinstance(other, (int, float)):
+        if _is_integral(value) and _is_integral(other):
+            return int(value * other)
+        return float(value) * float(other)
     try:
         if int(value) == value and int(other) == other:
             return int(value * other)
@@ -13,52 +13,62 @@ from common.template_filters import filters  # isort:skip
 
 
 def hydrate_participant(player: "Player", **kwargs) -> None:
+    participant_vars = player.participant.vars
 
-    if not "uuid" in player.participant.vars:
-        treatment: Treatment = player.participant.vars.get("treatment", Treatment.choose())
+    if not "uuid" in participant_vars:
+        treatment: Treatment = participant_vars.get("treatment", Treatment.choose())
         _ = treatment.get_demand_rvs()  # initializes treatment._demand_rvs
 
-        player.participant.uuid = player.participant.vars.get("uuid", str(uuid4()))
-        player.participant.starttime = get_time()
-        player.participant.is_planner = player.participant.vars.get("is_planner", player.field_maybe_none("is_planner"))
-        player.participant.years_as_planner = player.participant.vars.get(
-            "years_as_planner", player.field_maybe_none("years_as_planner")
+        # NOTE: participant fields (see PARTICIPANT_FIELDS in settings.py) live in participant.vars, so set them in one update
+        participant_vars.update(
+            uuid=participant_vars.get("uuid", str(uuid4())),
+            starttime=get_time(),
+            is_planner=participant_vars.get("is_planner", player.field_maybe_none("is_planner")),
+            years_as_planner=participant_vars.get("years_as_planner", player.field_maybe_none("years_as_planner")),
+            job_title=participant_vars.get("job_title", player.field_maybe_none("job_title")),
+            does_consent=participant_vars.get("does_consent", player.field_maybe_none("does_consent")),
+            # prolific_id=participant_vars.get("prolific_id", player.field_maybe_none("prolific_id")),
+            company_name=participant_vars.get("company_name", player.field_maybe_none("company_name")),
+            work_country=participant_vars.get("work_country", player.field_maybe_none("work_country")),
+            nationality=participant_vars.get("nationality", player.field_maybe_none("nationality")),
+            unit_costs=treatment.get_unit_costs(),
+            stock_units=0,
+            treatment=treatment,
+            history=initialize_game_history(),
+            game_results=[],
+            payoff_round=player.field_maybe_none("payoff_round") or treatment.get_payoff_round(),
         )
-        player.participant.job_title = player.participant.vars.get("job_title", player.field_maybe_none("job_title"))
-        player.participant.does_consent = player.participant.vars.get("does_consent", player.field_maybe_none("does_consent"))
-        # player.participant.prolific_id = player.participant.vars.get("prolific_id", player.field_maybe_none("prolific_id"))
-        player.participant.company_name = player.participant.vars.get("company_name", player.field_maybe_none("company_name"))
-        player.participant.work_country = player.participant.vars.get("work_country", player.field_maybe_none("work_country"))
-        player.participant.nationality = player.participant.vars.get("nationality", player.field_maybe_none("nationality"))
-        player.participant.unit_costs = treatment.get_unit_costs()
-        player.participant.stock_units = 0
-        player.participant.treatment = treatment
-        player.participant.history = initialize_game_history()
-        player.participant.game_results = []
-        player.participant.payoff_round = player.field_maybe_none("payoff_round") or treatment.get_payoff_round()
+
+
+_GAME_HISTORY_TEMPLATE: Dict[str, Any] = dict(
+    period=None,
+    ou=None,
+    du=None,
+    su_before=None,
+    su_after=None,
+    ooq=None,
+    revenue=None,
+    cost=None,
+    profit=None,
+    cumulative_profit=None,
+)
 
 
 def initialize_game_history() -> List[Dict[str, Any]]:
-    return [
-        dict(
-            period=i + 1,
-            ou=None,
-            du=None,
-            su_before=0 if i == 0 else None,
-            su_after=None,
-            ooq=None,
-            revenue=None,
-            cost=None,
-            profit=None,
-            cumulative_profit=None,
-        )
-        for i in range(C.ROUNDS_PER_GAME)
-    ]
+    history = [_GAME_HISTORY_TEMPLATE.copy() for _ in range(C.ROUNDS_PER_GAME)]
+    for i, period in enumerate(history):
+        period["period"] = i + 1
+    history[0]["su_before"] = 0
+    return history
 
 
 class Subsession(BaseSubsession):
     @staticmethod
     def creating_session(subsession: BaseSubsession):
+        # NOTE: oTree calls creating_session once per round, but participants are the same in every round and
+        # all of them are hydrated in round 1, so skip querying the players of the remaining rounds
+        if subsession.round_number > 1:
+            return
         for player in subsession.get_players():
             hydrate_participant(player)
 
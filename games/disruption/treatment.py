@@ -39,6 +39,7 @@ class DisruptionGameOne(Flag):
 TREATMENT_MAP: Dict[int, Tuple[VariabilityDegree, DisruptionGameOne]] = {
     i + 1: params for i, params in enumerate(product(list(VariabilityDegree), list(DisruptionGameOne)))
 }
+TREATMENT_INDICES: Tuple[int, ...] = tuple(TREATMENT_MAP)
 
 # NOTE: use lru cache to save time when making repeated calls because drawing large samples is slow
 @lru_cache(maxsize=10)
@@ -56,14 +57,16 @@ class Distribution(PydanticModel):
         extra = Extra.allow
 
     @classmethod
-    def from_treatment(cls, treatment: "Treatment") -> "UnitCosts":
-        if treatment.variance_choice == "low":
-            mu, sigma = 500, 50
-            mu_disrupted, sigma_disrupted = 500, 100
-        else:
-            mu, sigma = 500, 100
-            mu_disrupted, sigma_disrupted = 500, 200
-        return Distribution(mu=mu, sigma=sigma, mu_disrupted=mu_disrupted, sigma_disrupted=sigma_disrupted)
+    def from_treatment(cls, treatment: "Treatment") -> "Distribution":
+        return DISTRIBUTION_MAP[treatment.variance_choice]
+
+
+# NOTE: distributions only depend on the treatment's variance choice, so build them once at import time
+# {'low': Distribution(mu=500, sigma=50, ...), 'high': Distribution(mu=500, sigma=100, ...)}
+DISTRIBUTION_MAP: Dict[str, Distribution] = {
+    VariabilityDegree.LOW.value: Distribution(mu=500, sigma=50, mu_disrupted=500, sigma_disrupted=100),
+    VariabilityDegree.HIGH.value: Distribution(mu=500, sigma=100, mu_disrupted=500, sigma_disrupted=200),
+}
 
 
 class UnitCosts(PydanticModel):
@@ -77,12 +80,17 @@ class UnitCosts(PydanticModel):
 
     @classmethod
     def from_treatment(cls, treatment: "Treatment") -> "UnitCosts":
-        return UnitCosts(rcpu=15.0, wcpu=6.0, hcpu=1.0)
+        return UNIT_COSTS
+
+
+# NOTE: unit costs are the same for every treatment, so build (and validate) them once at import time
+UNIT_COSTS = UnitCosts(rcpu=15.0, wcpu=6.0, hcpu=1.0)
 
 
 class Treatment(PydanticModel):
     idx: conint(strict=True, ge=1, le=len(TREATMENT_MAP))
     _demand_rvs: List[float] = []
+    _demand_rvs_disrupted: List[float] = []
     _disrupted: bool = False
     _distribution: Distribution = None
     _png_file: Path = None
@@ -92,8 +100,7 @@ class Treatment(PydanticModel):
         extra = Extra.allow
 
     def reset(self):
-        size = len(self._demand_rvs) if self._demand_rvs else C.RVS_SIZE
-        self._demand_rvs = self.get_demand_rvs(size=size)
+        # NOTE: samples of both distributions are kept, so resetting only needs to switch back to the undisrupted one
         self._disrupted = False
         self._distribution = None
         self._png_file: Path = None
@@ -113,7 +120,7 @@ class Treatment(PydanticModel):
 
     @classmethod
     def choose(cls) -> "Treatment":
-        return Treatment(idx=random.choice(list(TREATMENT_MAP)))
+        return Treatment(idx=random.choice(TREATMENT_INDICES))
 
     def disrupt(self) -> None:
         self._disrupted = True
@@ -158,7 +165,7 @@ class Treatment(PydanticModel):
 
     def get_demand(self, randomly: bool = True, player: Optional[BasePlayer] = None) -> int:
         if randomly:
-            return round(random.choice(self._demand_rvs))
+            return round(random.choice(self.get_demand_rvs()))
         else:
             assert_concrete_player(player)
 
@@ -167,13 +174,20 @@ class Treatment(PydanticModel):
             return int(TREATMENT_DEMAND_DATA_MAP[self.idx][game_idx][round_idx])
 
     def get_demand_rvs(self, size: int = C.RVS_SIZE) -> List[float]:
-        """Return samples from the treatment's distribution"""
+        """Return samples from the treatment's distribution, or from its disrupted distribution once disrupted.
+
+        Samples of each distribution are drawn the first time they're needed and kept, so toggling the
+        disruption (see `disrupt` & `reset`) swaps between them instead of redrawing.
+        """
         distribution = self.get_distribution()
         if self.is_disrupted():
-            mu, sigma = distribution.mu_disrupted, distribution.sigma_disrupted
-        else:
-            mu, sigma = distribution.mu, distribution.sigma
-        self._demand_rvs = sample_normal_rvs(mu, sigma, size=size)
+            if len(self._demand_rvs_disrupted) != size:
+                self._demand_rvs_disrupted = sample_normal_rvs(
+                    distribution.mu_disrupted, distribution.sigma_disrupted, size=size
+                )
+            return self._demand_rvs_disrupted
+        if len(self._demand_rvs) != size:
+            self._demand_rvs = sample_normal_rvs(distribution.mu, distribution.sigma, size=size)
         return self._demand_rvs
 
     def get_optimal_order_quantity(self) -> float:
@@ -9,27 +9,33 @@ from .util import get_time, initialize_game_history, is_practice_round
 
 
 def creating_session(subsession: Subsession):
+    # NOTE: oTree calls creating_session once per round, but participants are the same in every round and
+    # all of them are hydrated in round 1, so skip querying the players of the remaining rounds
+    if subsession.round_number > 1:
+        return
     for player in subsession.get_players():
         hydrate_participant(player)
 
 
 def hydrate_participant(player: "Player", **kwargs) -> None:
+    participant_vars = player.participant.vars
 
-    if not "uuid" in player.participant.vars:
-        treatment: Treatment = player.participant.vars.get("treatment", Treatment.choose())
+    if not "uuid" in participant_vars:
+        treatment: Treatment = participant_vars.get("treatment", Treatment.choose())
         _ = treatment.get_demand_rvs()  # initializes treatment._demand_rvs
 
-        player.participant.uuid = player.participant.vars.get("uuid", str(uuid4()))
-        player.participant.starttime = get_time()
-        player.participant.is_planner = player.participant.vars.get("is_planner", player.field_maybe_none("is_planner"))
-        player.participant.gender_identity = player.participant.vars.get(
-            "gender_identity", player.field_maybe_none("gender_identity")
+        # NOTE: participant fields (see PARTICIPANT_FIELDS in settings.py) live in participant.vars, so set them in one update
+        participant_vars.update(
+            uuid=participant_vars.get("uuid", str(uuid4())),
+            starttime=get_time(),
+            is_planner=participant_vars.get("is_planner", player.field_maybe_none("is_planner")),
+            gender_identity=participant_vars.get("gender_identity", player.field_maybe_none("gender_identity")),
+            does_consent=participant_vars.get("does_consent", player.field_maybe_none("does_consent")),
+            unit_costs=UnitCosts.from_treatment(treatment),
+            stock_units=0,
+            treatment=treatment,
+            history=initialize_game_history(is_practice=is_practice_round(player.round_number)),
+            practice_results=[],
+            game_results=[],
+            payoff_round=player.field_maybe_none("payoff_round") or treatment.get_payoff_round(),
         )
-        player.participant.does_consent = player.participant.vars.get("does_consent", player.field_maybe_none("does_consent"))
-        player.participant.unit_costs = UnitCosts.from_treatment(treatment)
-        player.participant.stock_units = 0
-        player.participant.treatment = player.participant.vars.get("treatment", Treatment.choose())
-        player.participant.history = initialize_game_history(is_practice=is_practice_round(player.round_number))
-        player.participant.practice_results = []
-        player.participant.game_results = []
-        player.participant.payoff_round = player.field_maybe_none("payoff_round") or treatment.get_payoff_round()
@@ -19,6 +19,7 @@ from .util import (
     as_static_path,
     call_safe,
     get_app_name,
+    get_cumulative_profit,
     get_game_number,
     get_game_rounds,
     get_optimal_order_quantity,
@@ -95,7 +96,7 @@ class ShortHorizonPage(Page):
         if is_practice:
             distribution = treatment.get_practice_distribution()
         else:
-            distribution = treatment.get_distribution()
+            distribution = treatment.distribution
 
         payoff_round = player.participant.vars.get("payoff_round", None)
         real_round_number = get_real_round_number(player.round_number)
@@ -182,7 +183,7 @@ class ShortHorizonPage(Page):
     def js_vars(player: Player) -> dict:
         _vars = ShortHorizonPage.vars_for_template(player).copy()
         treatment = player.participant.treatment
-        _vars.update(demand_rvs=treatment.get_demand_rvs())
+        _vars.update(demand_rvs=treatment.get_demand_rvs().tolist())
         return _vars
 
 
@@ -314,7 +315,7 @@ class PracticeDecide(ShortHorizonPage):
             revenue=float(revenue),
             cost=float(cost),
             profit=float(profit),
-            cumulative_profit=float(sum(p.profit for p in player.in_rounds(1, player.round_number))),
+            cumulative_profit=get_cumulative_profit(player, player.participant.history, idx, first_round=1),
         )
         player.participant.history[idx] = hist
 
@@ -395,7 +396,7 @@ class Decide(ShortHorizonPage):
             revenue=float(revenue),
             cost=float(cost),
             profit=float(profit),
-            cumulative_profit=float(sum(p.profit for p in player.in_rounds(*round_range))),
+            cumulative_profit=get_cumulative_profit(player, player.participant.history, idx, first_round=round_range[0]),
         )
         player.participant.history[idx] = hist
 
@@ -4,13 +4,13 @@ import random
 import traceback
 from decimal import Decimal
 from enum import Enum, IntEnum
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from itertools import product
 from pathlib import Path
+from statistics import NormalDist
 from typing import AbstractSet, Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
-import scipy.stats as stats
 from otree.api import BasePlayer, Currency
 from otree.currency import _CurrencyEncoder
 from pydantic import BaseModel, Field, StrBytes, confloat, conint, constr, root_validator, typing, validator
@@ -23,10 +23,17 @@ from common.pydanticmodel import PydanticModel  # isort:skip
 from common.colors import COLORS  # isort:skip
 
 
+# NOTE: draw samples from a PCG64 generator rather than numpy's legacy global random state
+_RNG = np.random.default_rng()
+
+
 # NOTE: use lru cache to save time when making repeated calls because drawing large samples is slow
 @lru_cache(maxsize=10)
-def sample_normal_rvs(mu: float, sigma: float, size: int = int(1e4)) -> List[float]:
-    return np.random.normal(loc=mu, scale=sigma, size=size).tolist()
+def sample_normal_rvs(mu: float, sigma: float, size: int = int(1e4)) -> np.ndarray:
+    rvs = _RNG.normal(loc=mu, scale=sigma, size=size)
+    # the cached array is shared between treatments, so make sure no caller can modify it in place
+    rvs.flags.writeable = False
+    return rvs
 
 
 class PracticeTreatmentId(IntEnum):
@@ -67,11 +74,14 @@ class Distribution(PydanticModel):
 
         return TREATMENT_MAP[treatment.id][0]
 
-    @staticmethod
+    @classmethod
     def from_practice_treatment_id(cls, practice_treatment_id: PracticeTreatmentId = None) -> "Distribution":
         # return TREATMENT_MAP[practice_treatment_id][0]
         # Note the distribution for practice is a constant (mean: 100, var: 10):
-        return Distribution(mu=100, sigma=10)
+        return PRACTICE_DISTRIBUTION
+
+
+PRACTICE_DISTRIBUTION = Distribution(mu=PRACTICE_MEANS[0], sigma=PRACTICE_SIGMAS[0])
 
 
 UNIT_COSTS = [
@@ -175,10 +185,31 @@ TREATMENT_MAP: Dict[int, Tuple[Distribution, UnitCosts, Multiplier, Profitex]] =
 }
 
 
+def compute_optimal_order_quantity(distribution: Distribution, unit_costs: UnitCosts) -> float:
+    overage_cost = unit_costs.wcpu - unit_costs.scpu
+    underage_cost = unit_costs.rcpu - unit_costs.wcpu
+    # critical fractile
+    critical_fractile = float(underage_cost / (underage_cost + overage_cost))
+    # critical_demand: inverse CDF at critical fractile (NormalDist.inv_cdf implements Wichura's AS241 algorithm)
+    critical_demand = NormalDist().inv_cdf(critical_fractile)
+    return float(distribution.mu + critical_demand * distribution.sigma)
+
+
+# NOTE: the optimal order quantity only depends on the treatment id, so compute it once per treatment at import time
+OPTIMAL_ORDER_QUANTITY_MAP: Dict[int, float] = {
+    treatment_id: compute_optimal_order_quantity(distribution, unit_costs)
+    for treatment_id, (distribution, unit_costs, *_) in TREATMENT_MAP.items()
+}
+
+TREATMENT_IDS: Tuple[int, ...] = tuple(TREATMENT_MAP)
+# NOTE: pilot test treatment probabilities (in the order of TREATMENT_IDS), stored cumulatively for `random.choices`
+TREATMENT_CUM_WEIGHTS: Tuple[float, ...] = tuple(itertools.accumulate([0.17, 0.42, 0.07, 0.09, 0.25, 0]))
+
+
 class Treatment(PydanticModel):
     id: conint(strict=True, ge=1, le=len(TREATMENT_MAP))
     practice_treatment_id: PracticeTreatmentId
-    _demand_rvs: List[float] = []
+    _demand_rvs: Optional[np.ndarray] = None
     _disrupted: bool = False
     _distribution: Distribution = None
     _png_file: Path = None
@@ -187,9 +218,10 @@ class Treatment(PydanticModel):
     class Config:
         extra = Extra.allow
         arbitrary_types_allowed = True
+        keep_untouched = (cached_property,)
 
     def reset(self):
-        size = len(self._demand_rvs) if self._demand_rvs else C.RVS_SIZE
+        size = self._demand_rvs.size if self._demand_rvs is not None else C.RVS_SIZE
 
         self._demand_rvs = self.get_demand_rvs(size=size)
         self._disrupted: bool = False
@@ -204,9 +236,8 @@ class Treatment(PydanticModel):
     @classmethod
     def choose(cls) -> "Treatment":
         # TODO: restore after pilot test is complete
-        # treatment_id = random.choice(list(TREATMENT_MAP))
-        probs = [0.17, 0.42, 0.07, 0.09, 0.25, 0]
-        treatment_id = random.choices(list(TREATMENT_MAP), probs)[0]
+        # treatment_id = random.choice(TREATMENT_IDS)
+        treatment_id = random.choices(TREATMENT_IDS, cum_weights=TREATMENT_CUM_WEIGHTS)[0]
         treatment = TREATMENT_MAP[treatment_id]
         unit_costs: UnitCosts = treatment[1]
         if unit_costs.category == "high":
@@ -231,7 +262,8 @@ class Treatment(PydanticModel):
     def get_practice_unit_costs(self) -> UnitCosts:
         return UnitCosts.from_practice_treatment_id(self.practice_treatment_id)
 
-    def get_distribution(self) -> Distribution:
+    @cached_property
+    def distribution(self) -> Distribution:
         return Distribution.from_treatment(self)
 
     def get_practice_distribution(self):
@@ -303,7 +335,7 @@ class Treatment(PydanticModel):
     def get_demand(self, randomly: bool = True, player: Optional[BasePlayer] = None) -> int:
         if randomly:
             # random selection
-            return round(random.choice(self._demand_rvs))
+            return round(float(random.choice(self._demand_rvs)))
         elif is_practice_round(player.round_number):
             # each practice round has a pre-defined # of demand units
             if player.round_number == 1:
@@ -323,22 +355,14 @@ class Treatment(PydanticModel):
             round_id = get_round_in_game(player.round_number) - 1
             return int(TREATMENT_DEMAND_DATA_MAP[self.id][game_id][round_id])
 
-    def get_demand_rvs(self, size: int = C.RVS_SIZE) -> List[float]:
+    def get_demand_rvs(self, size: int = C.RVS_SIZE) -> np.ndarray:
         """Return samples from the treatment's distribution"""
-        distribution = self.get_distribution()
+        distribution = self.distribution
         self._demand_rvs = sample_normal_rvs(distribution.mu, distribution.sigma, size=size)
         return self._demand_rvs
 
     def get_optimal_order_quantity(self) -> float:
-        unit_costs = self.get_unit_costs()
-        distribution = self.get_distribution()
-        overage_cost = unit_costs.wcpu - unit_costs.scpu
-        underage_cost = unit_costs.rcpu - unit_costs.wcpu
-        # critical fractile
-        critical_fractile = float(underage_cost / (underage_cost + overage_cost))
-        # critical_demand: inverse CDF at critical fractile
-        critical_demand = stats.norm.ppf(critical_fractile)
-        return float(distribution.mu + critical_demand * distribution.sigma)
+        return OPTIMAL_ORDER_QUANTITY_MAP[self.id]
 
     @staticmethod
     def check_png(png_file: Path) -> bool:
@@ -388,7 +412,7 @@ class Treatment(PydanticModel):
         import matplotlib.pyplot as plt
         import seaborn as sns
 
-        distribution = self.get_practice_distribution() if practice else self.get_distribution()
+        distribution = self.get_practice_distribution() if practice else self.distribution
         mu, sigma = distribution.mu, distribution.sigma
 
         # color_key = "red" if C.APP_NAME == "disruption" and self.is_disrupted() else "ut_orange"
@@ -417,7 +441,7 @@ class Treatment(PydanticModel):
 
         # make distribution curve
         x = np.linspace(xmin, xmax, 200)
-        p = stats.norm.pdf(x, mu, sigma)
+        p = np.exp(-0.5 * ((x - mu) / sigma) ** 2) / (sigma * np.sqrt(2 * np.pi))
 
         # plot distribution curve
         figsize = (5, 4)  # (width, height)
@@ -7,7 +7,6 @@ from pathlib import Path
 from types import ModuleType
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from otree.api import BasePlayer, Currency, currency_range
@@ -15,7 +14,6 @@ from otree.models import Participant
 from otree.room import BaseRoom
 from otree.session import Session
 from pydantic import BaseConfig, BaseModel
-from scipy import stats
 
 from .constants import C
 
@@ -37,6 +35,18 @@ def initialize_game_history(is_practice: bool = False) -> List[Dict[str, Any]]:
     ]
 
 
+def get_cumulative_profit(player: BasePlayer, history: List[Dict[str, Any]], idx: int, first_round: int) -> float:
+    """Return the player's cumulative profit from `first_round` through their current round.
+
+    The running total is carried over from the previous period's entry in `history`, so earlier rounds are only
+    queried when that entry hasn't been filled in.
+    """
+    previous_cumulative_profit = history[idx - 1]["cumulative_profit"] if idx > 0 else 0.0
+    if previous_cumulative_profit is None:
+        return float(sum(p.profit for p in player.in_rounds(first_round, player.round_number)))
+    return previous_cumulative_profit + float(player.profit)
+
+
 def as_static_path(path: Path):
     if str(C.STATIC_DIR) + "/" in str(path):
         return str(path).replace(str(C.STATIC_DIR) + "/", C.APP_NAME + "/")
@@ -243,6 +253,7 @@ def lognormalize_normal_samples(normal_rvs: np.ndarray) -> np.ndarray:
         plt.show()
 
     """
+    from scipy import stats
 
     size = len(normal_rvs)
 
@@ -296,6 +307,8 @@ def normalize_lognormal_samples(lognormal_rvs: np.ndarray) -> np.ndarray:
         plt.plot(x, norm.pdf(x), linewidth=2, color='r')
         plt.show()
     """
+    from scipy import stats
+
     mu, sig = stats.norm.fit(lognormal_rvs)
     norm = stats.norm(mu, sig)
     return norm.rvs(len(lognormal_rvs))
@@ -310,6 +323,7 @@ def get_time(iso: bool = False) -> float:
 
 def reorderLegend(ax=None, order=None, key=None, unique=False, **legend_kwargs):
     """Returns tuple of handles, labels for axis ax, after reordering them to conform to the label order `order`, and if unique is True, after removing entries with duplicate labels."""
+    import matplotlib.pyplot as plt
 
     if ax is None:
         ax = plt.gca()